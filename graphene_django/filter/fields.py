@@ -1,7 +1,11 @@
 from collections import OrderedDict
-from functools import partial
+from functools import cached_property, partial
+from inspect import getattr_static
 
+from django import forms
 from django.core.exceptions import ValidationError
+from django_filters.filters import FilterMethod
+from django_filters.filterset import BaseFilterSet
 
 from graphene.types.argument import to_arguments
 from graphene.types.enum import EnumType
@@ -27,6 +31,51 @@ def convert_enum(data):
         return data
 
 
+def filter_is_noop_without_value(filter_):
+    """
+    Check whether the filter leaves the queryset untouched when given no
+    value, i.e. it is optional and filters through the stock django_filters
+    `filter` or `method` path.
+    """
+    if filter_.extra.get("required"):
+        return False
+    filter_method = vars(filter_).get("filter")
+    if filter_method is not None:
+        return type(filter_method) is FilterMethod
+    return type(filter_).filter.__module__.startswith("django_filters.")
+
+
+def filterset_is_noop_without_data(filterset_class):
+    """
+    Check whether the FilterSet relies on the stock django_filters machinery
+    to build, validate and filter the queryset, in which case filtering
+    without any data leaves the queryset untouched.
+
+    Graphene's own GlobalIDFilter, GlobalIDMultipleChoiceFilter, ListFilter
+    and ArrayFilter are not stock filters, so any FilterSet using them is
+    always built. These are the default filters for ids, foreign keys,
+    many-to-many relations and `__in` lookups.
+    """
+    return (
+        filterset_class._meta.form is forms.Form
+        and all(
+            getattr_static(filterset_class, name) is getattr_static(BaseFilterSet, name)
+            for name in (
+                "__init__",
+                "get_form_class",
+                "qs",
+                "filter_queryset",
+                "form",
+                "is_valid",
+            )
+        )
+        and all(
+            filter_is_noop_without_value(filter_)
+            for filter_ in filterset_class.base_filters.values()
+        )
+    )
+
+
 class DjangoFilterConnectionField(DjangoConnectionField):
     def __init__(
         self,
@@ -40,46 +89,54 @@ class DjangoFilterConnectionField(DjangoConnectionField):
     ):
         self._fields = fields
         self._provided_filterset_class = filterset_class
-        self._filterset_class = None
-        self._filtering_args = None
         self._extra_filter_meta = extra_filter_meta
         self._base_args = None
+        self._args = None
         super().__init__(type_, *args, **kwargs)
 
     @property
     def args(self):
-        return to_arguments(self._base_args or OrderedDict(), self.filtering_args)
+        if self._args is None:
+            self._args = to_arguments(
+                self._base_args or OrderedDict(), self.filtering_args
+            )
+        return self._args
 
     @args.setter
     def args(self, args):
         self._base_args = args
+        self._args = None
 
-    @property
+    @cached_property
     def filterset_class(self):
-        if not self._filterset_class:
-            fields = self._fields or self.node_type._meta.filter_fields
-            meta = {"model": self.model, "fields": fields}
-            if self._extra_filter_meta:
-                meta.update(self._extra_filter_meta)
-
-            filterset_class = (
-                self._provided_filterset_class or self.node_type._meta.filterset_class
-            )
-            self._filterset_class = get_filterset_class(filterset_class, **meta)
+        fields = self._fields or self.node_type._meta.filter_fields
+        meta = {"model": self.model, "fields": fields}
+        if self._extra_filter_meta:
+            meta.update(self._extra_filter_meta)
 
-        return self._filterset_class
+        filterset_class = (
+            self._provided_filterset_class or self.node_type._meta.filterset_class
+        )
+        return get_filterset_class(filterset_class, **meta)
 
-    @property
+    @cached_property
     def filtering_args(self):
-        if not self._filtering_args:
-            self._filtering_args = get_filtering_args_from_filterset(
-                self.filterset_class, self.node_type
-            )
-        return self._filtering_args
+        return get_filtering_args_from_filterset(self.filterset_class, self.node_type)
+
+    @cached_property
+    def filterset_is_noop_without_data(self):
+        return filterset_is_noop_without_data(self.filterset_class)
 
     @classmethod
     def resolve_queryset(
-        cls, connection, iterable, info, args, filtering_args, filterset_class
+        cls,
+        connection,
+        iterable,
+        info,
+        args,
+        filtering_args,
+        filterset_class,
+        filterset_is_noop_without_data=False,
     ):
         def filter_kwargs():
             kwargs = {}
@@ -92,9 +149,12 @@ class DjangoFilterConnectionField(DjangoConnectionField):
 
         qs = super().resolve_queryset(connection, iterable, info, args)
 
-        filterset = filterset_class(
-            data=filter_kwargs(), queryset=qs, request=info.context
-        )
+        data = filter_kwargs()
+        if not data and filterset_is_noop_without_data:
+            # No filter was requested: skip building the FilterSet and its form.
+            return qs
+
+        filterset = filterset_class(data=data, queryset=qs, request=info.context)
         if filterset.is_valid():
             return filterset.qs
         raise ValidationError(filterset.form.errors.as_json())
@@ -104,4 +164,5 @@ class DjangoFilterConnectionField(DjangoConnectionField):
             self.resolve_queryset,
             filterset_class=self.filterset_class,
             filtering_args=self.filtering_args,
+            filterset_is_noop_without_data=self.filterset_is_noop_without_data,
         )
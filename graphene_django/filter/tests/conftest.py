@@ -9,6 +9,7 @@ import graphene
 from graphene.relay import Node
 from graphene_django import DjangoObjectType
 from graphene_django.filter import ArrayFilter
+from graphene_django.tests.models import Article, Reporter
 from graphene_django.utils import DJANGO_FILTER_INSTALLED
 
 from ...compat import ArrayField
@@ -190,3 +191,39 @@ def Query(EventType):
 @pytest.fixture
 def schema(Query):
     return graphene.Schema(query=Query)
+
+
+@pytest.fixture
+def two_reporters(db):
+    """
+    Two reporters without articles, with primary keys 1 and 2 set explicitly
+    for the same reason as in `two_reporters_two_articles`.
+    """
+    return Reporter.objects.bulk_create(
+        [
+            Reporter(id=1, first_name="John", last_name="Doe", email="john@doe.com"),
+            Reporter(id=2, first_name="Adam", last_name="Doe", email="adam@doe.com"),
+        ]
+    )
+
+
+@pytest.fixture
+def two_reporters_two_articles(db):
+    """
+    Two reporters, each having written (and edited) one article.
+    Primary keys are set explicitly so that they are known to the tests and
+    available on every database backend after `bulk_create`.
+    """
+    r1, r2 = Reporter.objects.bulk_create(
+        [
+            Reporter(id=1, first_name="r1", last_name="r1", email="r1@test.com"),
+            Reporter(id=2, first_name="r2", last_name="r2", email="r2@test.com"),
+        ]
+    )
+    a1, a2 = Article.objects.bulk_create(
+        [
+            Article(id=1, headline="a1", reporter=r1, editor=r1),
+            Article(id=2, headline="a2", reporter=r2, editor=r2),
+        ]
+    )
+    return r1, r2, a1, a2
@@ -1,60 +1,100 @@
-from datetime import datetime
+from functools import lru_cache
 from textwrap import dedent
+from unittest.mock import patch
 
 import pytest
+from django import forms
 from django.db.models import TextField, Value
 from django.db.models.functions import Concat
+from graphql_relay import to_global_id
 
 from graphene import Argument, Boolean, Decimal, Field, ObjectType, Schema, String
 from graphene.relay import Node
 from graphene_django import DjangoObjectType
 from graphene_django.forms import GlobalIDFormField, GlobalIDMultipleChoiceField
+from graphene_django.registry import Registry
 from graphene_django.tests.models import Article, Person, Pet, Reporter
-from graphene_django.utils import DJANGO_FILTER_INSTALLED
 
-pytestmark = []
+django_filters = pytest.importorskip("django_filters")
 
-if DJANGO_FILTER_INSTALLED:
-    import django_filters
-    from django_filters import FilterSet, NumberFilter, OrderingFilter
+from django_filters import FilterSet, NumberFilter, OrderingFilter  # noqa: E402
+from django_filters.filterset import BaseFilterSet  # noqa: E402
 
-    from graphene_django.filter import (
-        DjangoFilterConnectionField,
-        GlobalIDFilter,
-        GlobalIDMultipleChoiceFilter,
-    )
-    from graphene_django.filter.tests.filters import (
-        ArticleFilter,
-        PetFilter,
-        ReporterFilter,
-    )
-else:
-    pytestmark.append(
-        pytest.mark.skipif(
-            True, reason="django_filters not installed or not compatible"
-        )
-    )
+from graphene_django.filter import (  # noqa: E402
+    DjangoFilterConnectionField,
+    GlobalIDFilter,
+    GlobalIDMultipleChoiceFilter,
+    utils as filter_utils,
+)
+from graphene_django.filter.tests.filters import (  # noqa: E402
+    ArticleFilter,
+    PetFilter,
+    ReporterFilter,
+)
 
-if DJANGO_FILTER_INSTALLED:
 
-    class ArticleNode(DjangoObjectType):
-        class Meta:
-            model = Article
-            interfaces = (Node,)
-            fields = "__all__"
-            filter_fields = ("headline",)
+class ArticleNode(DjangoObjectType):
+    class Meta:
+        model = Article
+        interfaces = (Node,)
+        fields = "__all__"
+        filter_fields = ("headline",)
 
-    class ReporterNode(DjangoObjectType):
-        class Meta:
-            model = Reporter
-            interfaces = (Node,)
-            fields = "__all__"
 
-    class PetNode(DjangoObjectType):
-        class Meta:
-            model = Pet
-            interfaces = (Node,)
-            fields = "__all__"
+class ReporterNode(DjangoObjectType):
+    class Meta:
+        model = Reporter
+        interfaces = (Node,)
+        fields = "__all__"
+
+
+class PetNode(DjangoObjectType):
+    class Meta:
+        model = Pet
+        interfaces = (Node,)
+        fields = "__all__"
+
+
+# The filter nodes get their own registry so that the related types they
+# resolve to do not depend on the other types registered for these models.
+filter_node_registry = Registry()
+
+
+class ReporterFilterNode(DjangoObjectType):
+    class Meta:
+        model = Reporter
+        interfaces = (Node,)
+        fields = "__all__"
+        filter_fields = ["first_name", "articles"]
+        registry = filter_node_registry
+
+
+class ArticleFilterNode(DjangoObjectType):
+    class Meta:
+        model = Article
+        interfaces = (Node,)
+        fields = "__all__"
+        filter_fields = ["headline", "reporter"]
+        registry = filter_node_registry
+
+
+class FilterNodeQuery(ObjectType):
+    all_reporters = DjangoFilterConnectionField(ReporterFilterNode)
+    all_articles = DjangoFilterConnectionField(ArticleFilterNode)
+    reporter = Field(ReporterFilterNode)
+    article = Field(ArticleFilterNode)
+
+
+IGNORED_ARGUMENTS = frozenset(
+    ("offset", "after", "before", "first", "last", "order_by")
+)
+
+
+@pytest.fixture(scope="module")
+def filter_node_schema():
+    # Built on first use rather than at import, so that collecting the module
+    # (e.g. when its tests are deselected) does not pay for the schema.
+    return Schema(query=FilterNodeQuery)
 
 
 def get_args(field):
@@ -62,11 +102,13 @@ def get_args(field):
 
 
 def assert_arguments(field, *arguments):
-    ignore = ("offset", "after", "before", "first", "last", "order_by")
-    args = get_args(field)
-    actual = [name for name in args if name not in ignore and not name.startswith("_")]
-    assert set(arguments) == set(
-        actual
+    actual = frozenset(
+        name
+        for name in get_args(field)
+        if name not in IGNORED_ARGUMENTS and not name.startswith("_")
+    )
+    assert (
+        frozenset(arguments) == actual
     ), f"Expected arguments ({arguments}) did not match actual ({actual})"
 
 
@@ -133,7 +175,83 @@ def test_filter_shortcut_filterset_extra_meta():
     assert "headline" not in field.filterset_class.get_fields()
 
 
-def test_filter_shortcut_filterset_context():
+def test_filter_shortcut_filterset_is_cached():
+    field = DjangoFilterConnectionField(ArticleNode, fields=["headline"])
+    assert field.filterset_class is field.filterset_class
+    assert field.filtering_args is field.filtering_args
+    assert field.args is field.args
+
+
+def test_filterset_noop_check_is_computed_once():
+    field = DjangoFilterConnectionField(ArticleNode, fields=["headline"])
+    with patch(
+        "graphene_django.filter.fields.filterset_is_noop_without_data",
+        return_value=True,
+    ) as check:
+        field.get_queryset_resolver()
+        field.get_queryset_resolver()
+    check.assert_called_once_with(field.filterset_class)
+
+
+def test_filterset_noop_check_disabled_by_graphene_filters():
+    field = DjangoFilterConnectionField(ArticleNode, fields=["headline", "reporter"])
+    assert not field.filterset_is_noop_without_data
+
+
+def test_filter_shortcut_filterset_is_shared():
+    field = DjangoFilterConnectionField(ArticleNode, fields={"headline": ["exact"]})
+    same_field = DjangoFilterConnectionField(
+        ArticleNode, fields={"headline": ["exact"]}
+    )
+    other_field = DjangoFilterConnectionField(
+        ArticleNode, fields={"headline": ["icontains"]}
+    )
+    assert field.filterset_class is same_field.filterset_class
+    assert field.filterset_class is not other_field.filterset_class
+
+
+def test_filter_shortcut_filterset_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(filter_utils, "FILTERSET_CLASS_CACHE_SIZE", 1)
+    monkeypatch.setattr(filter_utils.get_filterset_class, "cache", {})
+
+    filterset_class = DjangoFilterConnectionField(
+        ArticleNode, fields={"headline": ["exact"]}
+    ).filterset_class
+    other_filterset_class = DjangoFilterConnectionField(
+        ArticleNode, fields={"headline": ["icontains"]}
+    ).filterset_class
+    same_filterset_class = DjangoFilterConnectionField(
+        ArticleNode, fields={"headline": ["exact"]}
+    ).filterset_class
+    # Building the other FilterSet evicted the first one from the cache.
+    assert filterset_class is not same_filterset_class
+    assert other_filterset_class not in filter_utils.get_filterset_class.cache.values()
+    assert len(filter_utils.get_filterset_class.cache) == 1
+
+
+def test_filter_shortcut_filterset_keeps_fields_order():
+    field = DjangoFilterConnectionField(
+        ArticleNode, fields={"reporter": ["exact"], "headline": ["exact"]}
+    )
+    reversed_field = DjangoFilterConnectionField(
+        ArticleNode, fields={"headline": ["exact"], "reporter": ["exact"]}
+    )
+    assert [name for name in field.args if name in ("reporter", "headline")] == [
+        "reporter",
+        "headline",
+    ]
+    assert [
+        name for name in reversed_field.args if name in ("reporter", "headline")
+    ] == ["headline", "reporter"]
+
+
+def test_filter_explicit_filterset_is_not_shared():
+    field = DjangoFilterConnectionField(PetNode, filterset_class=PetFilter)
+    same_field = DjangoFilterConnectionField(PetNode, filterset_class=PetFilter)
+    assert field.filterset_class is not same_field.filterset_class
+
+
+def test_filter_shortcut_filterset_context(two_reporters_two_articles):
     class ArticleContextFilter(django_filters.FilterSet):
         class Meta:
             model = Article
@@ -149,38 +267,24 @@ def test_filter_shortcut_filterset_context():
             ArticleNode, filterset_class=ArticleContextFilter
         )
 
-    r1 = Reporter.objects.create(first_name="r1", last_name="r1", email="r1@test.com")
-    r2 = Reporter.objects.create(first_name="r2", last_name="r2", email="r2@test.com")
-    Article.objects.create(
-        headline="a1",
-        pub_date=datetime.now(),
-        pub_date_time=datetime.now(),
-        reporter=r1,
-        editor=r1,
-    )
-    Article.objects.create(
-        headline="a2",
-        pub_date=datetime.now(),
-        pub_date_time=datetime.now(),
-        reporter=r2,
-        editor=r2,
-    )
+    _, r2, _, _ = two_reporters_two_articles
 
     class context:
         reporter = r2
 
+    schema = Schema(query=Query)
     query = """
-    query {
-        contextArticles {
-            edges {
-                node {
-                    headline
+        query {
+            contextArticles {
+                edges {
+                    node {
+                        headline
+                    }
                 }
             }
         }
-    }
-    """
-    schema = Schema(query=Query)
+        """
+
     result = schema.execute(query, context_value=context())
     assert not result.errors
 
@@ -189,40 +293,12 @@ def test_filter_shortcut_filterset_context():
 
 
 def test_filter_filterset_information_on_meta():
-    class ReporterFilterNode(DjangoObjectType):
-        class Meta:
-            model = Reporter
-            interfaces = (Node,)
-            fields = "__all__"
-            filter_fields = ["first_name", "articles"]
-
     field = DjangoFilterConnectionField(ReporterFilterNode)
     assert_arguments(field, "first_name", "articles")
     assert_not_orderable(field)
 
 
 def test_filter_filterset_information_on_meta_related():
-    class ReporterFilterNode(DjangoObjectType):
-        class Meta:
-            model = Reporter
-            interfaces = (Node,)
-            fields = "__all__"
-            filter_fields = ["first_name", "articles"]
-
-    class ArticleFilterNode(DjangoObjectType):
-        class Meta:
-            model = Article
-            interfaces = (Node,)
-            fields = "__all__"
-            filter_fields = ["headline", "reporter"]
-
-    class Query(ObjectType):
-        all_reporters = DjangoFilterConnectionField(ReporterFilterNode)
-        all_articles = DjangoFilterConnectionField(ArticleFilterNode)
-        reporter = Field(ReporterFilterNode)
-        article = Field(ArticleFilterNode)
-
-    Schema(query=Query)
     articles_field = ReporterFilterNode._meta.fields["articles"].get_type()
     assert_arguments(articles_field, "headline", "reporter")
     assert_not_orderable(articles_field)
@@ -300,63 +376,27 @@ def test_filter_filterset_class_information_on_meta_related():
     assert_not_orderable(articles_field)
 
 
-def test_filter_filterset_related_results():
-    class ReporterFilterNode(DjangoObjectType):
-        class Meta:
-            model = Reporter
-            interfaces = (Node,)
-            fields = "__all__"
-            filter_fields = ["first_name", "articles"]
-
-    class ArticleFilterNode(DjangoObjectType):
-        class Meta:
-            interfaces = (Node,)
-            model = Article
-            fields = "__all__"
-            filter_fields = ["headline", "reporter"]
-
-    class Query(ObjectType):
-        all_reporters = DjangoFilterConnectionField(ReporterFilterNode)
-        all_articles = DjangoFilterConnectionField(ArticleFilterNode)
-        reporter = Field(ReporterFilterNode)
-        article = Field(ArticleFilterNode)
-
-    r1 = Reporter.objects.create(first_name="r1", last_name="r1", email="r1@test.com")
-    r2 = Reporter.objects.create(first_name="r2", last_name="r2", email="r2@test.com")
-    Article.objects.create(
-        headline="a1",
-        pub_date=datetime.now(),
-        pub_date_time=datetime.now(),
-        reporter=r1,
-        editor=r1,
-    )
-    Article.objects.create(
-        headline="a2",
-        pub_date=datetime.now(),
-        pub_date_time=datetime.now(),
-        reporter=r2,
-        editor=r2,
-    )
-
+@pytest.mark.usefixtures("two_reporters_two_articles")
+def test_filter_filterset_related_results(filter_node_schema):
     query = """
-    query {
-        allReporters {
-            edges {
-                node {
-                    articles {
-                        edges {
-                            node {
-                                headline
+        query {
+            allReporters {
+                edges {
+                    node {
+                        articles {
+                            edges {
+                                node {
+                                    headline
+                                }
                             }
                         }
                     }
                 }
             }
         }
-    }
-    """
-    schema = Schema(query=Query)
-    result = schema.execute(query)
+        """
+
+    result = filter_node_schema.execute(query)
     assert not result.errors
     # We should only get back a single article for each reporter
     assert (
@@ -413,115 +453,44 @@ def test_global_id_field_relation():
     assert id_filter.field_class == GlobalIDFormField
 
 
-def test_global_id_field_relation_with_filter():
-    class ReporterFilterNode(DjangoObjectType):
-        class Meta:
-            model = Reporter
-            interfaces = (Node,)
-            fields = "__all__"
-            filter_fields = ["first_name", "articles"]
-
-    class ArticleFilterNode(DjangoObjectType):
-        class Meta:
-            model = Article
-            interfaces = (Node,)
-            fields = "__all__"
-            filter_fields = ["headline", "reporter"]
-
-    class Query(ObjectType):
-        all_reporters = DjangoFilterConnectionField(ReporterFilterNode)
-        all_articles = DjangoFilterConnectionField(ArticleFilterNode)
-        reporter = Field(ReporterFilterNode)
-        article = Field(ArticleFilterNode)
-
-    r1 = Reporter.objects.create(first_name="r1", last_name="r1", email="r1@test.com")
-    r2 = Reporter.objects.create(first_name="r2", last_name="r2", email="r2@test.com")
-    Article.objects.create(
-        headline="a1",
-        pub_date=datetime.now(),
-        pub_date_time=datetime.now(),
-        reporter=r1,
-        editor=r1,
-    )
-    Article.objects.create(
-        headline="a2",
-        pub_date=datetime.now(),
-        pub_date_time=datetime.now(),
-        reporter=r2,
-        editor=r2,
-    )
-
+@pytest.mark.usefixtures("two_reporters_two_articles")
+def test_global_id_field_relation_with_filter(filter_node_schema):
     # Query articles created by the reporter `r1`
-    query = """
-    query {
-        allArticles (reporter: "UmVwb3J0ZXJGaWx0ZXJOb2RlOjE=") {
-            edges {
-                node {
-                    id
-                }
-            }
-        }
-    }
-    """
-    schema = Schema(query=Query)
-    result = schema.execute(query)
+    reporter_id = to_global_id("ReporterFilterNode", 1)
+    query = f"""
+        query {{
+            allArticles (reporter: "{reporter_id}") {{
+                edges {{
+                    node {{
+                        id
+                    }}
+                }}
+            }}
+        }}
+        """
+
+    result = filter_node_schema.execute(query)
     assert not result.errors
     # We should only get back a single article
     assert len(result.data["allArticles"]["edges"]) == 1
 
 
-def test_global_id_field_relation_with_filter_not_valid_id():
-    class ReporterFilterNode(DjangoObjectType):
-        class Meta:
-            model = Reporter
-            interfaces = (Node,)
-            fields = "__all__"
-            filter_fields = ["first_name", "articles"]
-
-    class ArticleFilterNode(DjangoObjectType):
-        class Meta:
-            model = Article
-            interfaces = (Node,)
-            fields = "__all__"
-            filter_fields = ["headline", "reporter"]
-
-    class Query(ObjectType):
-        all_reporters = DjangoFilterConnectionField(ReporterFilterNode)
-        all_articles = DjangoFilterConnectionField(ArticleFilterNode)
-        reporter = Field(ReporterFilterNode)
-        article = Field(ArticleFilterNode)
-
-    r1 = Reporter.objects.create(first_name="r1", last_name="r1", email="r1@test.com")
-    r2 = Reporter.objects.create(first_name="r2", last_name="r2", email="r2@test.com")
-    Article.objects.create(
-        headline="a1",
-        pub_date=datetime.now(),
-        pub_date_time=datetime.now(),
-        reporter=r1,
-        editor=r1,
-    )
-    Article.objects.create(
-        headline="a2",
-        pub_date=datetime.now(),
-        pub_date_time=datetime.now(),
-        reporter=r2,
-        editor=r2,
-    )
-
+@pytest.mark.usefixtures("two_reporters_two_articles")
+def test_global_id_field_relation_with_filter_not_valid_id(filter_node_schema):
     # Filter by the global ID that does not exist
     query = """
-    query {
-        allArticles (reporter: "fake_global_id") {
-            edges {
-                node {
-                    id
+        query {
+            allArticles (reporter: "fake_global_id") {
+                edges {
+                    node {
+                        id
+                    }
                 }
             }
         }
-    }
-    """
-    schema = Schema(query=Query)
-    result = schema.execute(query)
+        """
+
+    result = filter_node_schema.execute(query)
     assert "Invalid ID specified." in result.errors[0].message
 
 
@@ -582,30 +551,35 @@ def test_filter_filterset_related_results_with_filter():
     class Query(ObjectType):
         all_reporters = DjangoFilterConnectionField(ReporterFilterNode)
 
-    Reporter.objects.create(
-        first_name="A test user", last_name="Last Name", email="test1@test.com"
-    )
-    Reporter.objects.create(
-        first_name="Other test user",
-        last_name="Other Last Name",
-        email="test2@test.com",
-    )
-    Reporter.objects.create(
-        first_name="Random", last_name="RandomLast", email="random@test.com"
+    Reporter.objects.bulk_create(
+        [
+            Reporter(
+                first_name="A test user", last_name="Last Name", email="test1@test.com"
+            ),
+            Reporter(
+                first_name="Other test user",
+                last_name="Other Last Name",
+                email="test2@test.com",
+            ),
+            Reporter(
+                first_name="Random", last_name="RandomLast", email="random@test.com"
+            ),
+        ]
     )
 
+    schema = Schema(query=Query)
     query = """
-    query {
-        allReporters(firstName_Icontains: "test") {
-            edges {
-                node {
-                    id
+        query {
+            allReporters(firstName_Icontains: "test") {
+                edges {
+                    node {
+                        id
+                    }
                 }
             }
         }
-    }
-    """
-    schema = Schema(query=Query)
+        """
+
     result = schema.execute(query)
     assert not result.errors
     # We should only get two reporters
@@ -665,31 +639,57 @@ def test_should_query_filter_node_limit():
         def resolve_all_reporters(self, info, **args):
             return Reporter.objects.order_by("a_choice")
 
-    Reporter.objects.create(
-        first_name="Bob", last_name="Doe", email="bobdoe@example.com", a_choice=2
-    )
-    r = Reporter.objects.create(
-        first_name="John", last_name="Doe", email="johndoe@example.com", a_choice=1
+    # Primary keys are explicit as bulk_create does not set them on every backend
+    _, r = Reporter.objects.bulk_create(
+        [
+            Reporter(
+                id=1,
+                first_name="Bob",
+                last_name="Doe",
+                email="bobdoe@example.com",
+                a_choice=2,
+            ),
+            Reporter(
+                id=2,
+                first_name="John",
+                last_name="Doe",
+                email="johndoe@example.com",
+                a_choice=1,
+            ),
+        ]
     )
 
-    Article.objects.create(
-        headline="Article Node 1",
-        pub_date=datetime.now(),
-        pub_date_time=datetime.now(),
-        reporter=r,
-        editor=r,
-        lang="es",
-    )
-    Article.objects.create(
-        headline="Article Node 2",
-        pub_date=datetime.now(),
-        pub_date_time=datetime.now(),
-        reporter=r,
-        editor=r,
-        lang="en",
+    Article.objects.bulk_create(
+        [
+            Article(id=1, headline="Article Node 1", reporter=r, editor=r, lang="es"),
+            Article(id=2, headline="Article Node 2", reporter=r, editor=r, lang="en"),
+        ]
     )
 
     schema = Schema(query=Query)
+    expected = {
+        "allReporters": {
+            "edges": [
+                {
+                    "node": {
+                        "id": to_global_id("ReporterType", 2),
+                        "firstName": "John",
+                        "articles": {
+                            "edges": [
+                                {
+                                    "node": {
+                                        "id": to_global_id("ArticleType", 1),
+                                        "lang": "ES",
+                                    }
+                                }
+                            ]
+                        },
+                    }
+                }
+            ]
+        }
+    }
+
     query = """
         query NodeFilteringQuery {
             allReporters(limit: 1) {
@@ -709,96 +709,76 @@ def test_should_query_filter_node_limit():
                 }
             }
         }
-    """
-
-    expected = {
-        "allReporters": {
-            "edges": [
-                {
-                    "node": {
-                        "id": "UmVwb3J0ZXJUeXBlOjI=",
-                        "firstName": "John",
-                        "articles": {
-                            "edges": [
-                                {"node": {"id": "QXJ0aWNsZVR5cGU6MQ==", "lang": "ES"}}
-                            ]
-                        },
-                    }
-                }
-            ]
-        }
-    }
+        """
 
     result = schema.execute(query)
     assert not result.errors
     assert result.data == expected
 
 
-def test_order_by():
-    class ReporterType(DjangoObjectType):
-        class Meta:
-            model = Reporter
-            interfaces = (Node,)
-            fields = "__all__"
+QUERY_ORDER_BY = """
+    query OrderByCamelCase {
+        allReporters(orderBy: "-firstName") {
+            edges {
+                node {
+                    firstName
+                }
+            }
+        }
+    }
 
-    class Query(ObjectType):
+    query OrderBySnakeCase {
+        allReporters(orderBy: "-first_name") {
+            edges {
+                node {
+                    firstName
+                }
+            }
+        }
+    }
+
+    query OrderByInvalidField {
+        allReporters(orderBy: "-firstname") {
+            edges {
+                node {
+                    firstName
+                }
+            }
+        }
+    }
+    """
+
+
+def test_order_by():
+    class ReporterType(DjangoObjectType):
+        class Meta:
+            model = Reporter
+            interfaces = (Node,)
+            fields = "__all__"
+
+    class Query(ObjectType):
         all_reporters = DjangoFilterConnectionField(
             ReporterType, filterset_class=ReporterFilter
         )
 
-    Reporter.objects.create(first_name="b")
-    Reporter.objects.create(first_name="a")
+    Reporter.objects.bulk_create([Reporter(first_name="b"), Reporter(first_name="a")])
 
     schema = Schema(query=Query)
-    query = """
-        query NodeFilteringQuery {
-            allReporters(orderBy: "-firstName") {
-                edges {
-                    node {
-                        firstName
-                    }
-                }
-            }
-        }
-    """
     expected = {
         "allReporters": {
             "edges": [{"node": {"firstName": "b"}}, {"node": {"firstName": "a"}}]
         }
     }
 
-    result = schema.execute(query)
+    result = schema.execute(QUERY_ORDER_BY, operation_name="OrderByCamelCase")
     assert not result.errors
     assert result.data == expected
 
-    query = """
-        query NodeFilteringQuery {
-            allReporters(orderBy: "-first_name") {
-                edges {
-                    node {
-                        firstName
-                    }
-                }
-            }
-        }
-    """
-
-    result = schema.execute(query)
+    result = schema.execute(QUERY_ORDER_BY, operation_name="OrderBySnakeCase")
     assert not result.errors
     assert result.data == expected
 
-    query = """
-        query NodeFilteringQuery {
-            allReporters(orderBy: "-firstname") {
-                edges {
-                    node {
-                        firstName
-                    }
-                }
-            }
-        }
-    """
-    result = schema.execute(query)
+    result = schema.execute(QUERY_ORDER_BY, operation_name="OrderByInvalidField")
     assert result.errors
 
 
@@ -823,10 +803,11 @@ def test_order_by_is_preserved():
 
             return reporters
 
-    Reporter.objects.create(first_name="b")
-    Reporter.objects.create(first_name="a")
+    Reporter.objects.bulk_create([Reporter(first_name="b"), Reporter(first_name="a")])
 
     schema = Schema(query=Query)
+    expected = {"allReporters": {"edges": [{"node": {"firstName": "a"}}]}}
+
     query = """
         query NodeFilteringQuery {
             allReporters(first: 1) {
@@ -837,13 +818,14 @@ def test_order_by_is_preserved():
                 }
             }
         }
-    """
-    expected = {"allReporters": {"edges": [{"node": {"firstName": "a"}}]}}
+        """
 
     result = schema.execute(query)
     assert not result.errors
     assert result.data == expected
 
+    reverse_expected = {"allReporters": {"edges": [{"node": {"firstName": "b"}}]}}
+
     reverse_query = """
         query NodeFilteringQuery {
             allReporters(first: 1, reverseOrder: true) {
@@ -854,9 +836,7 @@ def test_order_by_is_preserved():
                 }
             }
         }
-    """
-
-    reverse_expected = {"allReporters": {"edges": [{"node": {"firstName": "b"}}]}}
+        """
 
     reverse_result = schema.execute(reverse_query)
 
@@ -864,6 +844,19 @@ def test_order_by_is_preserved():
     assert reverse_result.data == reverse_expected
 
 
+QUERY_FIRST_REPORTER_FULL_NAME = """
+    query NodeFilteringQuery {
+        allReporters(first: 1) {
+            edges {
+                node {
+                    fullName
+                }
+            }
+        }
+    }
+    """
+
+
 def test_annotation_is_preserved():
     class ReporterType(DjangoObjectType):
         full_name = String()
@@ -887,24 +880,13 @@ def test_annotation_is_preserved():
                 )
             )
 
-    Reporter.objects.create(first_name="John", last_name="Doe")
+    Reporter.objects.bulk_create([Reporter(first_name="John", last_name="Doe")])
 
     schema = Schema(query=Query)
 
-    query = """
-        query NodeFilteringQuery {
-            allReporters(first: 1) {
-                edges {
-                    node {
-                        fullName
-                    }
-                }
-            }
-        }
-    """
     expected = {"allReporters": {"edges": [{"node": {"fullName": "John Doe"}}]}}
 
-    result = schema.execute(query)
+    result = schema.execute(QUERY_FIRST_REPORTER_FULL_NAME)
 
     assert not result.errors
     assert result.data == expected
@@ -930,24 +912,13 @@ def test_annotation_with_only():
                 )
             )
 
-    Reporter.objects.create(first_name="John", last_name="Doe")
+    Reporter.objects.bulk_create([Reporter(first_name="John", last_name="Doe")])
 
     schema = Schema(query=Query)
 
-    query = """
-        query NodeFilteringQuery {
-            allReporters(first: 1) {
-                edges {
-                    node {
-                        fullName
-                    }
-                }
-            }
-        }
-    """
     expected = {"allReporters": {"edges": [{"node": {"fullName": "John Doe"}}]}}
 
-    result = schema.execute(query)
+    result = schema.execute(QUERY_FIRST_REPORTER_FULL_NAME)
 
     assert not result.errors
     assert result.data == expected
@@ -970,10 +941,11 @@ def test_node_get_queryset_is_called():
             ReporterType, reverse_order=Boolean()
         )
 
-    Reporter.objects.create(first_name="b")
-    Reporter.objects.create(first_name="a")
+    Reporter.objects.bulk_create([Reporter(first_name="b"), Reporter(first_name="a")])
 
     schema = Schema(query=Query)
+    expected = {"allReporters": {"edges": [{"node": {"firstName": "b"}}]}}
+
     query = """
         query NodeFilteringQuery {
             allReporters(first: 10) {
@@ -984,176 +956,335 @@ def test_node_get_queryset_is_called():
                 }
             }
         }
-    """
-    expected = {"allReporters": {"edges": [{"node": {"firstName": "b"}}]}}
+        """
 
     result = schema.execute(query)
     assert not result.errors
     assert result.data == expected
 
 
-def test_integer_field_filter_type():
-    class PetType(DjangoObjectType):
+QUERY_ALL_REPORTERS = """
+    query NodeFilteringQuery {
+        allReporters {
+            edges {
+                node {
+                    firstName
+                }
+            }
+        }
+    }
+    """
+
+
+def build_reporters_schema(filterset_class):
+    class ReporterType(DjangoObjectType):
         class Meta:
-            model = Pet
+            model = Reporter
             interfaces = (Node,)
-            filter_fields = {"age": ["exact"]}
-            fields = ("age",)
+            fields = "__all__"
 
     class Query(ObjectType):
-        pets = DjangoFilterConnectionField(PetType)
+        all_reporters = DjangoFilterConnectionField(
+            ReporterType, filterset_class=filterset_class
+        )
 
-    schema = Schema(query=Query)
+    return Schema(query=Query)
 
-    assert str(schema) == dedent(
-        """\
-        type Query {
-          pets(offset: Int, before: String, after: String, first: Int, last: Int, age: Int): PetTypeConnection
-        }
 
-        type PetTypeConnection {
-          \"""Pagination data for this connection.\"""
-          pageInfo: PageInfo!
+def test_filterset_not_built_without_filter_arguments():
+    class ReporterFilter(FilterSet):
+        class Meta:
+            model = Reporter
+            fields = ["first_name"]
+
+    Reporter.objects.bulk_create([Reporter(first_name="a"), Reporter(first_name="b")])
+    schema = build_reporters_schema(ReporterFilter)
 
-          \"""Contains the nodes in this connection.\"""
-          edges: [PetTypeEdge]!
+    query = """
+        query NodeFilteringQuery {
+            allReporters(firstName: "b") {
+                edges {
+                    node {
+                        firstName
+                    }
+                }
+            }
+        }
+        """
+
+    with patch.object(
+        BaseFilterSet, "__init__", autospec=True, side_effect=BaseFilterSet.__init__
+    ) as filterset_init:
+        result = schema.execute(QUERY_ALL_REPORTERS)
+        assert not result.errors
+        assert len(result.data["allReporters"]["edges"]) == 2
+        filterset_init.assert_not_called()
+
+        result = schema.execute(query)
+        assert not result.errors
+        assert result.data == {
+            "allReporters": {"edges": [{"node": {"firstName": "b"}}]}
         }
+        filterset_init.assert_called_once()
 
-        \"""
-        The Relay compliant `PageInfo` type, containing data necessary to paginate this connection.
-        \"""
-        type PageInfo {
-          \"""When paginating forwards, are there more items?\"""
-          hasNextPage: Boolean!
 
-          \"""When paginating backwards, are there more items?\"""
-          hasPreviousPage: Boolean!
+def test_custom_filterset_init_built_without_filter_arguments():
+    filtersets = []
 
-          \"""When paginating backwards, the cursor to continue.\"""
-          startCursor: String
+    class ReporterFilter(FilterSet):
+        class Meta:
+            model = Reporter
+            fields = ["first_name"]
 
-          \"""When paginating forwards, the cursor to continue.\"""
-          endCursor: String
-        }
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            filtersets.append(self)
 
-        \"""A Relay edge containing a `PetType` and its cursor.\"""
-        type PetTypeEdge {
-          \"""The item at the end of the edge\"""
-          node: PetType
+    Reporter.objects.bulk_create([Reporter(first_name="a"), Reporter(first_name="b")])
+    schema = build_reporters_schema(ReporterFilter)
 
-          \"""A cursor for use in pagination\"""
-          cursor: String!
-        }
+    result = schema.execute(QUERY_ALL_REPORTERS)
+    assert not result.errors
+    assert len(result.data["allReporters"]["edges"]) == 2
+    assert len(filtersets) == 1
 
-        type PetType implements Node {
-          age: Int!
 
-          \"""The ID of the object\"""
-          id: ID!
-        }
+def test_filterset_init_restricts_queryset_without_filter_arguments():
+    class ReporterFilter(FilterSet):
+        class Meta:
+            model = Reporter
+            fields = ["first_name"]
 
-        \"""An object with an ID\"""
-        interface Node {
-          \"""The ID of the object\"""
-          id: ID!
-        }"""
-    )
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.queryset = self.queryset.filter(first_name="a")
 
+    Reporter.objects.bulk_create([Reporter(first_name="a"), Reporter(first_name="b")])
+
+    schema = build_reporters_schema(ReporterFilter)
+    result = schema.execute(QUERY_ALL_REPORTERS)
+    assert not result.errors
+    assert result.data == {"allReporters": {"edges": [{"node": {"firstName": "a"}}]}}
+
+
+def test_filter_default_restricts_queryset_without_filter_arguments():
+    class DefaultFirstNameFilter(django_filters.CharFilter):
+        def filter(self, qs, value):
+            return super().filter(qs, value or "a")
+
+    class ReporterFilter(FilterSet):
+        first_name = DefaultFirstNameFilter()
+
+        class Meta:
+            model = Reporter
+            fields = ["first_name"]
+
+    Reporter.objects.bulk_create([Reporter(first_name="a"), Reporter(first_name="b")])
+
+    schema = build_reporters_schema(ReporterFilter)
+    result = schema.execute(QUERY_ALL_REPORTERS)
+    assert not result.errors
+    assert result.data == {"allReporters": {"edges": [{"node": {"firstName": "a"}}]}}
+
+
+@lru_cache(maxsize=None)
+def test_form_default_restricts_queryset_without_filter_arguments():
+    class DefaultFirstNameForm(forms.Form):
+        def clean(self):
+            cleaned_data = super().clean()
+            cleaned_data["first_name"] = cleaned_data.get("first_name") or "a"
+            return cleaned_data
+
+    class ReporterFilter(FilterSet):
+        class Meta:
+            model = Reporter
+            fields = ["first_name"]
+
+        def get_form_class(self):
+            return type(
+                "ReporterFilterForm",
+                (DefaultFirstNameForm, super().get_form_class()),
+                {},
+            )
+
+    Reporter.objects.bulk_create([Reporter(first_name="a"), Reporter(first_name="b")])
+
+    schema = build_reporters_schema(ReporterFilter)
+    result = schema.execute(QUERY_ALL_REPORTERS)
+    assert not result.errors
+    assert result.data == {"allReporters": {"edges": [{"node": {"firstName": "a"}}]}}
+
+
+def build_pet_schema(**lookups):
+    """
+    Build a schema exposing a `pets` connection filtered with the given
+    lookups (as tuples) per field. Schemas are immutable once built, so
+    tests asking for the same filters share one.
+    """
 
-def test_other_filter_types():
     class PetType(DjangoObjectType):
         class Meta:
             model = Pet
             interfaces = (Node,)
-            filter_fields = {"age": ["exact", "isnull", "lt"]}
+            filter_fields = lookups
             fields = ("age",)
 
     class Query(ObjectType):
         pets = DjangoFilterConnectionField(PetType)
 
-    schema = Schema(query=Query)
+    return Schema(query=Query)
 
-    assert str(schema) == dedent(
-        """\
-        type Query {
-          pets(offset: Int, before: String, after: String, first: Int, last: Int, age: Int, age_Isnull: Boolean, age_Lt: Int): PetTypeConnection
-        }
 
-        type PetTypeConnection {
-          \"""Pagination data for this connection.\"""
-          pageInfo: PageInfo!
+EXPECTED_PET_SCHEMA = dedent(
+    """\
+    type Query {
+      pets(offset: Int, before: String, after: String, first: Int, last: Int, age: Int): PetTypeConnection
+    }
 
-          \"""Contains the nodes in this connection.\"""
-          edges: [PetTypeEdge]!
-        }
+    type PetTypeConnection {
+      \"""Pagination data for this connection.\"""
+      pageInfo: PageInfo!
 
-        \"""
-        The Relay compliant `PageInfo` type, containing data necessary to paginate this connection.
-        \"""
-        type PageInfo {
-          \"""When paginating forwards, are there more items?\"""
-          hasNextPage: Boolean!
+      \"""Contains the nodes in this connection.\"""
+      edges: [PetTypeEdge]!
+    }
 
-          \"""When paginating backwards, are there more items?\"""
-          hasPreviousPage: Boolean!
+    \"""
+    The Relay compliant `PageInfo` type, containing data necessary to paginate this connection.
+    \"""
+    type PageInfo {
+      \"""When paginating forwards, are there more items?\"""
+      hasNextPage: Boolean!
 
-          \"""When paginating backwards, the cursor to continue.\"""
-          startCursor: String
+      \"""When paginating backwards, are there more items?\"""
+      hasPreviousPage: Boolean!
 
-          \"""When paginating forwards, the cursor to continue.\"""
-          endCursor: String
-        }
+      \"""When paginating backwards, the cursor to continue.\"""
+      startCursor: String
 
-        \"""A Relay edge containing a `PetType` and its cursor.\"""
-        type PetTypeEdge {
-          \"""The item at the end of the edge\"""
-          node: PetType
+      \"""When paginating forwards, the cursor to continue.\"""
+      endCursor: String
+    }
 
-          \"""A cursor for use in pagination\"""
-          cursor: String!
-        }
+    \"""A Relay edge containing a `PetType` and its cursor.\"""
+    type PetTypeEdge {
+      \"""The item at the end of the edge\"""
+      node: PetType
 
-        type PetType implements Node {
-          age: Int!
+      \"""A cursor for use in pagination\"""
+      cursor: String!
+    }
 
-          \"""The ID of the object\"""
-          id: ID!
-        }
+    type PetType implements Node {
+      age: Int!
 
-        \"""An object with an ID\"""
-        interface Node {
-          \"""The ID of the object\"""
-          id: ID!
-        }"""
-    )
+      \"""The ID of the object\"""
+      id: ID!
+    }
 
+    \"""An object with an ID\"""
+    interface Node {
+      \"""The ID of the object\"""
+      id: ID!
+    }"""
+)
+
+
+def test_integer_field_filter_type():
+    schema = build_pet_schema(age=("exact",))
+
+    assert str(schema) == EXPECTED_PET_SCHEMA
+
+
+EXPECTED_PET_FILTER_TYPES_SCHEMA = dedent(
+    """\
+    type Query {
+      pets(offset: Int, before: String, after: String, first: Int, last: Int, age: Int, age_Isnull: Boolean, age_Lt: Int): PetTypeConnection
+    }
+
+    type PetTypeConnection {
+      \"""Pagination data for this connection.\"""
+      pageInfo: PageInfo!
+
+      \"""Contains the nodes in this connection.\"""
+      edges: [PetTypeEdge]!
+    }
+
+    \"""
+    The Relay compliant `PageInfo` type, containing data necessary to paginate this connection.
+    \"""
+    type PageInfo {
+      \"""When paginating forwards, are there more items?\"""
+      hasNextPage: Boolean!
+
+      \"""When paginating backwards, are there more items?\"""
+      hasPreviousPage: Boolean!
+
+      \"""When paginating backwards, the cursor to continue.\"""
+      startCursor: String
+
+      \"""When paginating forwards, the cursor to continue.\"""
+      endCursor: String
+    }
+
+    \"""A Relay edge containing a `PetType` and its cursor.\"""
+    type PetTypeEdge {
+      \"""The item at the end of the edge\"""
+      node: PetType
+
+      \"""A cursor for use in pagination\"""
+      cursor: String!
+    }
+
+    type PetType implements Node {
+      age: Int!
+
+      \"""The ID of the object\"""
+      id: ID!
+    }
+
+    \"""An object with an ID\"""
+    interface Node {
+      \"""The ID of the object\"""
+      id: ID!
+    }"""
+)
+
+
+def test_other_filter_types():
+    schema = build_pet_schema(age=("exact", "isnull", "lt"))
+
+    assert str(schema) == EXPECTED_PET_FILTER_TYPES_SCHEMA
 
-def test_filter_filterset_based_on_mixin():
-    class ArticleFilterMixin(FilterSet):
-        @classmethod
-        def get_filters(cls):
-            filters = super(FilterSet, cls).get_filters()
-            filters.update(
-                {
-                    "viewer__email__in": django_filters.CharFilter(
-                        method="filter_email_in", field_name="reporter__email__in"
-                    )
-                }
-            )
 
-            return filters
+class ArticleFilterMixin(FilterSet):
+    @classmethod
+    def get_filters(cls):
+        filters = super(FilterSet, cls).get_filters()
+        filters["viewer__email__in"] = django_filters.CharFilter(
+            method="filter_email_in", field_name="reporter__email__in"
+        )
+        return filters
+
+    def filter_email_in(self, queryset, name, value):
+        # name is always the filter's field_name, reporter__email__in.
+        return queryset.filter(reporter__email__in=(value,))
+
+
+class NewArticleFilter(ArticleFilterMixin, ArticleFilter):
+    pass
+
 
-        def filter_email_in(self, queryset, name, value):
-            return queryset.filter(**{name: [value]})
+VIEWER_ARTICLE_HEADLINES = ("Hello", "Hello 2", "Hello 3", "Hello 4", "Hello 5")
 
-    class NewArticleFilter(ArticleFilterMixin, ArticleFilter):
-        pass
 
+@pytest.fixture(scope="module")
+def viewer_article_schema():
     class NewReporterNode(DjangoObjectType):
         class Meta:
             model = Reporter
             interfaces = (Node,)
-            fields = "__all__"
+            fields = ("email",)
 
     class NewArticleFilterNode(DjangoObjectType):
         viewer = Field(NewReporterNode)
@@ -1161,40 +1292,51 @@ def test_filter_filterset_based_on_mixin():
         class Meta:
             model = Article
             interfaces = (Node,)
-            fields = "__all__"
+            fields = ("headline", "reporter")
             filterset_class = NewArticleFilter
 
+        @classmethod
+        def get_queryset(cls, queryset, info):
+            return queryset.select_related("reporter")
+
         def resolve_viewer(self, info):
             return self.reporter
 
     class Query(ObjectType):
         all_articles = DjangoFilterConnectionField(NewArticleFilterNode)
 
-    reporter_1 = Reporter.objects.create(
-        first_name="John", last_name="Doe", email="john@doe.com"
-    )
+    return Schema(query=Query)
 
-    article_1 = Article.objects.create(
-        headline="Hello",
-        reporter=reporter_1,
-        editor=reporter_1,
-        pub_date=datetime.now(),
-        pub_date_time=datetime.now(),
-    )
 
-    reporter_2 = Reporter.objects.create(
-        first_name="Adam", last_name="Doe", email="adam@doe.com"
-    )
-
-    Article.objects.create(
-        headline="Good Bye",
-        reporter=reporter_2,
-        editor=reporter_2,
-        pub_date=datetime.now(),
-        pub_date_time=datetime.now(),
+def test_filter_filterset_based_on_mixin(
+    viewer_article_schema, two_reporters, django_assert_num_queries
+):
+    reporter_1, reporter_2 = two_reporters
+    # Enough articles match the filter that resolving each viewer lazily would
+    # show up in the query count below.
+    Article.objects.bulk_create(
+        [
+            Article(headline=headline, reporter=reporter_1, editor=reporter_1)
+            for headline in VIEWER_ARTICLE_HEADLINES
+        ]
+        + [
+            Article(headline="Good Bye", reporter=reporter_2, editor=reporter_2),
+        ]
     )
 
-    schema = Schema(query=Query)
+    expected = {
+        "allArticles": {
+            "edges": [
+                {
+                    "node": {
+                        "headline": headline,
+                        "viewer": {"email": reporter_1.email},
+                    }
+                }
+                for headline in VIEWER_ARTICLE_HEADLINES
+            ]
+        }
+    }
 
     query = """
         query NodeFilteringQuery ($email: String!) {
@@ -1209,80 +1351,79 @@ def test_filter_filterset_based_on_mixin():
                 }
             }
         }
-    """
+        """
 
-    expected = {
-        "allArticles": {
-            "edges": [
-                {
-                    "node": {
-                        "headline": article_1.headline,
-                        "viewer": {"email": reporter_1.email},
-                    }
-                }
-            ]
-        }
-    }
-
-    result = schema.execute(query, variable_values={"email": reporter_1.email})
+    # One COUNT for the connection and one SELECT joining the reporters.
+    with django_assert_num_queries(2):
+        result = viewer_article_schema.execute(
+            query,
+            variable_values={"email": reporter_1.email},
+        )
 
     assert not result.errors
     assert result.data == expected
 
 
-def test_filter_string_contains():
+PERSON_NAMES = ("Jack", "Joe", "Jane", "Peter", "Bob")
+
+EXPECTED_PEOPLE_CONTAINING_JA = {
+    "people": {
+        "edges": [
+            {"node": {"name": "Jack"}},
+            {"node": {"name": "Jane"}},
+        ]
+    }
+}
+
+EXPECTED_PEOPLE_CONTAINING_O = {
+    "people": {
+        "edges": [
+            {"node": {"name": "Joe"}},
+            {"node": {"name": "Bob"}},
+        ]
+    }
+}
+
+
+@pytest.fixture(scope="module")
+def people_schema():
     class PersonType(DjangoObjectType):
         class Meta:
             model = Person
             interfaces = (Node,)
             fields = "__all__"
-            filter_fields = {"name": ["exact", "in", "contains", "icontains"]}
+            filter_fields = {"name": ("exact", "in", "contains", "icontains")}
 
     class Query(ObjectType):
         people = DjangoFilterConnectionField(PersonType)
 
-    schema = Schema(query=Query)
+    return Schema(query=Query)
 
-    Person.objects.bulk_create(
-        [
-            Person(name="Jack"),
-            Person(name="Joe"),
-            Person(name="Jane"),
-            Person(name="Peter"),
-            Person(name="Bob"),
-        ]
-    )
-    query = """query nameContain($filter: String) {
-        people(name_Contains: $filter) {
-            edges {
-                node {
-                    name
+
+@pytest.mark.parametrize(
+    "name_filter, expected",
+    [("Ja", EXPECTED_PEOPLE_CONTAINING_JA), ("o", EXPECTED_PEOPLE_CONTAINING_O)],
+)
+def test_filter_string_contains(people_schema, name_filter, expected):
+    Person.objects.bulk_create([Person(name=name) for name in PERSON_NAMES])
+    query = """
+        query nameContain($filter: String) {
+            people(name_Contains: $filter) {
+                edges {
+                    node {
+                        name
+                    }
                 }
             }
         }
-    }"""
-
-    result = schema.execute(query, variables={"filter": "Ja"})
-    assert not result.errors
-    assert result.data == {
-        "people": {
-            "edges": [
-                {"node": {"name": "Jack"}},
-                {"node": {"name": "Jane"}},
-            ]
-        }
-    }
+        """
 
-    result = schema.execute(query, variables={"filter": "o"})
+    result = people_schema.execute(
+        query,
+        variables={"filter": name_filter},
+    )
     assert not result.errors
-    assert result.data == {
-        "people": {
-            "edges": [
-                {"node": {"name": "Joe"}},
-                {"node": {"name": "Bob"}},
-            ]
-        }
-    }
+    assert result.data == expected
 
 
 def test_only_custom_filters():
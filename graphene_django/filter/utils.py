@@ -7,6 +7,9 @@ from ..forms import GlobalIDFormField, GlobalIDMultipleChoiceField
 from .filters import ListFilter, RangeFilter, TypedFilter
 from .filterset import custom_filterset_factory, setup_filterset
 
+# Number of generated FilterSet classes kept by `get_filterset_class`.
+FILTERSET_CLASS_CACHE_SIZE = 256
+
 
 def get_field_type(registry, model, field_name):
     """
@@ -103,21 +106,57 @@ def get_filtering_args_from_filterset(filterset_class, type):
     return args
 
 
+def freeze_meta(value):
+    """
+    Convert the FilterSet meta (and the lists and dicts it contains, such as
+    `fields`) to a hashable equivalent, so it can be used as a cache key.
+    Dict items keep their order, as it decides the order of the filters.
+    """
+    if isinstance(value, dict):
+        return tuple((key, freeze_meta(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_meta(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
 def get_filterset_class(filterset_class, **meta):
     """
     Get the class to be used as the FilterSet.
+    FilterSets generated from the meta alone are built once per meta and
+    shared, keeping only the most recently used ones.
     """
     if filterset_class:
         # If were given a FilterSet class, then set it up.
         graphene_filterset_class = setup_filterset(filterset_class)
-    else:
+        replace_csv_filters(graphene_filterset_class)
+        return graphene_filterset_class
+
+    cache = get_filterset_class.cache
+    try:
+        cache_key = freeze_meta(meta)
+        # Popped so that it is re-inserted as the most recently used below.
+        graphene_filterset_class = cache.pop(cache_key, None)
+    except TypeError:
+        # The meta contains values that can't be hashed: don't cache.
+        cache_key = graphene_filterset_class = None
+
+    if graphene_filterset_class is None:
         # Otherwise create one.
         graphene_filterset_class = custom_filterset_factory(**meta)
+        replace_csv_filters(graphene_filterset_class)
 
-    replace_csv_filters(graphene_filterset_class)
+    if cache_key is not None:
+        cache[cache_key] = graphene_filterset_class
+        if len(cache) > FILTERSET_CLASS_CACHE_SIZE:
+            del cache[next(iter(cache))]
     return graphene_filterset_class
 
 
+get_filterset_class.cache = {}
+
+
 def replace_csv_filters(filterset_class):
     """
     Replace the "in" and "range" filters (that are not explicitly declared)
@@ -47,7 +47,9 @@ class Reporter(models.Model):
     last_name = models.CharField(max_length=30)
     email = models.EmailField()
     pets = models.ManyToManyField("self")
-    a_choice = models.IntegerField(choices=CHOICES, null=True, blank=True)
+    a_choice = models.IntegerField(
+        choices=CHOICES, null=True, blank=True, db_index=True
+    )
     objects = models.Manager()
     doe_objects = DoeReporterManager()
     fans = models.ManyToManyField(Person)